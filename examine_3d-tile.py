@@ -8,30 +8,78 @@
 # - texture utilization,
 # - texture image size,
 # - 
-# The `process_glb_file` function takes a path to a GLB file, imports the mesh into Blender, calculates the statistics, and returns a dictionary with the results.
+# The `process_glb_file` function takes a path to a GLB file, reads the mesh arrays directly from the file (or imports it into Blender when the file uses features like Draco compression), calculates the statistics, and returns a dictionary with the results.
 # The `load_tileset` function loads a tileset JSON file, processes the tile structure, and returns a list of tile information dictionaries, including the tile URL, parent ID, LOD level, and screen space error.
-# The `process_tile_parallel` function is used to process each tile in parallel using a multiprocessing pool.
+# The `process_tile_buckets` function is used to process the tiles in parallel using a multiprocessing pool, every distinct GLB file is processed once.
 # The `write_results_to_csv` function writes the calculated statistics for all tiles to a CSV file.
 
-import bpy
-import bmesh
 import numpy as np
-from mathutils import Vector
 import sys
 import os
-import re
 import json
+import struct
+import base64
+import urllib.parse
 import csv
 import time
 import multiprocessing
 import contextlib
 import io
+import hashlib
+import functools
+import concurrent.futures
 
 script_start_time = time.time()
 
+# Directory for on-disk caches shared by all worker processes
+cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'tile_stats')
+
+# Part of every cache key, bump it whenever the computed statistics change
+stats_cache_version = 4
+
+# Set TILE_STATS_CACHE=0 to neither read nor write the result caches
+cache_enabled = os.environ.get('TILE_STATS_CACHE', '1') != '0'
+
+# The least recently used cache entries are removed above this size
+cache_max_bytes = 1 << 30
+
+# Blender is only needed for GLB files that cannot be read directly
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+# orjson is optional, it parses large tileset files faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Numba is optional, without it the rasterizer falls back to NumPy
+os.environ.setdefault('NUMBA_CACHE_DIR', os.path.join(cache_dir, 'numba'))
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# CuPy is optional, with a CUDA device it rasterizes dense meshes on the GPU
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+# Below this many bounding box pixels the GPU transfers cost more than they save
+gpu_min_pixels = 50_000_000
+
+# Set once the GPU rasterizer has failed, the worker then stays on the CPU
+gpu_failed = False
+
 # Global counters for unique numeric IDs
 tile_id_counter = 0
 
+# Per worker thread that reads the next GLB file while the current one is processed
+prefetch_executor = None
+
 ### Misc 
 
 @contextlib.contextmanager
@@ -47,93 +95,390 @@ def suppress_output():
             sys.stdout = old_stdout
             sys.stderr = old_stderr
 
+### Caching
+
+def content_digest(*chunks):
+    h = hashlib.blake2b(digest_size=20)
+    h.update(str(stats_cache_version).encode())
+    for chunk in chunks:
+        h.update(chunk)
+    return h.hexdigest()
+
+def cache_file_path(kind, key, extension):
+    return os.path.join(cache_dir, kind, key[:2], f"{key}.{extension}")
+
+def write_cache_file(path, write):
+    # Write to a temporary file and rename it, so other workers never read a partial entry
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Error writing cache file {path}: {str(e)}")
+
+def touch_cache_file(path):
+    # Entries are evicted by modification time, so mark a hit as recently used
+    if not cache_enabled or not os.path.isfile(path):
+        return False
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return True
+
+def load_cached_stats(key):
+    path = cache_file_path('stats', key, 'json')
+    if not touch_cache_file(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def save_cached_stats(key, stats):
+    if cache_enabled:
+        write_cache_file(cache_file_path('stats', key, 'json'), lambda f: f.write(json.dumps(stats).encode()))
+
+def load_cached_rasterization(key):
+    path = cache_file_path('raster', key, 'npz')
+    if not touch_cache_file(path):
+        return None
+    with np.load(path) as data:
+        return data['pixel_counts'], int(data['used_pixels'])
+
+def save_cached_rasterization(key, pixel_counts, used_pixels):
+    if cache_enabled:
+        write_cache_file(cache_file_path('raster', key, 'npz'), lambda f: np.savez(f, pixel_counts=pixel_counts, used_pixels=used_pixels))
+
+def prune_cache():
+    # Removes the least recently used entries until the caches fit in cache_max_bytes
+    entries = []
+    for kind in ('stats', 'raster'):
+        for root, _, files in os.walk(os.path.join(cache_dir, kind)):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_size = sum(size for _, size, _ in entries)
+    entries.sort()
+    for _, size, path in entries:
+        if total_size <= cache_max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_size -= size
+
 ### Graphic processing
 
-def point_in_triangle_uv(p, triangle):
-    def sign(p1, p2, p3):
-        return (p1.x - p3.x) * (p2.y - p3.y) - (p2.x - p3.x) * (p1.y - p3.y)
-    
-    d1 = sign(p, triangle[0], triangle[1])
-    d2 = sign(p, triangle[1], triangle[2])
-    d3 = sign(p, triangle[2], triangle[0])
-    
-    has_neg = (d1 < 0) or (d2 < 0) or (d3 < 0)
-    has_pos = (d1 > 0) or (d2 > 0) or (d3 > 0)
-    
-    return not (has_neg and has_pos)
+def rasterize_triangle(triangle, u0, u1, v0, v1):
+    # Edge-function rasterizer. `triangle` is in pixel space, the result is a
+    # boolean mask of the pixels in [v0, v1) x [u0, u1) inside (or on) it.
+    # Each edge function is linear in x and y, so it is evaluated once at the
+    # top-left corner and stepped by its constant per-pixel derivatives.
+    (ax, ay), (bx, by), (cx, cy) = triangle[0], triangle[1], triangle[2]
 
-def calculate_texel_sizes_and_utilization(obj):
-    me = obj.data
-    bm = bmesh.new()
-    bm.from_mesh(me)
-    bm.faces.ensure_lookup_table()
-    
-    uv_layer = bm.loops.layers.uv.active
-    if not uv_layer:
+    e0 = (bx - ax) * (v0 - ay) - (by - ay) * (u0 - ax)
+    e1 = (cx - bx) * (v0 - by) - (cy - by) * (u0 - bx)
+    e2 = (ax - cx) * (v0 - cy) - (ay - cy) * (u0 - cx)
+    de0dx, de0dy = -(by - ay), bx - ax
+    de1dx, de1dy = -(cy - by), cx - bx
+    de2dx, de2dy = -(ay - cy), ax - cx
+
+    # The edge functions sum to twice the signed area, flip them for
+    # clockwise triangles so that inside is always E >= 0
+    if e0 + e1 + e2 < 0:
+        e0, e1, e2 = -e0, -e1, -e2
+        de0dx, de0dy, de1dx, de1dy, de2dx, de2dy = -de0dx, -de0dy, -de1dx, -de1dy, -de2dx, -de2dy
+
+    dx = np.arange(u1 - u0)[np.newaxis, :]
+    dy = np.arange(v1 - v0)[:, np.newaxis]
+
+    inside = (e0 + de0dx * dx + de0dy * dy) >= 0
+    inside &= (e1 + de1dx * dx + de1dy * dy) >= 0
+    inside &= (e2 + de2dx * dx + de2dy * dy) >= 0
+    return inside
+
+def face_pixel_range(triangle, grid_resolution):
+    # Pixel range covered by the bounding box of the face, clipped to the grid
+    us = [p[0] for p in triangle]
+    vs = [p[1] for p in triangle]
+    u0 = max(int(min(us)), 0)
+    u1 = min(int(max(us)) + 1, grid_resolution)
+    v0 = max(int(min(vs)), 0)
+    v1 = min(int(max(vs)) + 1, grid_resolution)
+    return u0, u1, v0, v1
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True)
+    def _rasterize_faces_numba(tri_px, grid_resolution, grid, band_counts, count_pixels):
+        # The grid is split into horizontal bands, one per thread. Every band
+        # walks all faces in order and only touches its own rows, so there are
+        # no write races and pixels are still claimed by the first face.
+        # Without count_pixels only the grid is filled in, band_counts then
+        # only sets the number of bands and can have no columns.
+        n_bands = band_counts.shape[0]
+        band_height = (grid_resolution + n_bands - 1) // n_bands
+        for band in numba.prange(n_bands):
+            band_v0 = band * band_height
+            band_v1 = min(band_v0 + band_height, grid_resolution)
+            for f in range(tri_px.shape[0]):
+                ax, ay = tri_px[f, 0, 0], tri_px[f, 0, 1]
+                bx, by = tri_px[f, 1, 0], tri_px[f, 1, 1]
+                cx, cy = tri_px[f, 2, 0], tri_px[f, 2, 1]
+
+                u0 = max(int(min(ax, bx, cx)), 0)
+                u1 = min(int(max(ax, bx, cx)) + 1, grid_resolution)
+                v0 = max(int(min(ay, by, cy)), 0)
+                v1 = min(int(max(ay, by, cy)) + 1, grid_resolution)
+                row0 = max(v0, band_v0)
+                row1 = min(v1, band_v1)
+                if u0 >= u1 or row0 >= row1:
+                    continue
+
+                # Same edge functions as rasterize_triangle
+                e0 = (bx - ax) * (v0 - ay) - (by - ay) * (u0 - ax)
+                e1 = (cx - bx) * (v0 - by) - (cy - by) * (u0 - bx)
+                e2 = (ax - cx) * (v0 - cy) - (ay - cy) * (u0 - cx)
+                de0dx, de0dy = -(by - ay), bx - ax
+                de1dx, de1dy = -(cy - by), cx - bx
+                de2dx, de2dy = -(ay - cy), ax - cx
+                if e0 + e1 + e2 < 0:
+                    e0, e1, e2 = -e0, -e1, -e2
+                    de0dx, de0dy, de1dx, de1dy, de2dx, de2dy = -de0dx, -de0dy, -de1dx, -de1dy, -de2dx, -de2dy
+
+                count = 0
+                for v in range(row0, row1):
+                    dy = v - v0
+                    for u in range(u0, u1):
+                        dx = u - u0
+                        if (e0 + de0dx * dx + de0dy * dy >= 0 and
+                                e1 + de1dx * dx + de1dy * dy >= 0 and
+                                e2 + de2dx * dx + de2dy * dy >= 0 and
+                                grid[v, u] == 0):
+                            grid[v, u] = 1
+                            count += 1
+                if count_pixels:
+                    band_counts[band, f] = count
+
+def rasterize_faces(tri_px, grid_resolution):
+    # Rasterizes the (F, 3, 2) pixel space triangles in order. Returns the
+    # coverage grid and, per face, the number of pixels it claimed first.
+    # A triangle identical to an earlier one only covers pixels that one
+    # already claimed, so just the first copy is rasterized and the
+    # duplicates keep a count of 0.
+    rows = np.ascontiguousarray(tri_px).reshape(len(tri_px), 6)
+    keys = rows.view(np.dtype((np.void, rows.itemsize * 6))).ravel()
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+
+    unique_counts, grid = rasterize_faces_in_order(tri_px[first], grid_resolution)
+    pixel_counts = np.zeros(len(tri_px), dtype=np.int64)
+    pixel_counts[first] = unique_counts
+    return pixel_counts, grid
+
+if cupy is not None:
+    # One block per triangle, its threads stride over the bounding box. Every
+    # covered pixel keeps the lowest index of the triangles covering it,
+    # which is the face that claims it first when rasterizing in order.
+    # Contracting into FMAs is disabled so the edge tests match the CPU.
+    _rasterize_faces_gpu_kernel = cupy.RawKernel(r'''
+    extern "C" __global__
+    void rasterize_faces(const double* tri_px, int n_faces, int grid_resolution, int* owner) {
+        for (int f = blockIdx.x; f < n_faces; f += gridDim.x) {
+            const double* t = tri_px + 6 * f;
+            double ax = t[0], ay = t[1], bx = t[2], by = t[3], cx = t[4], cy = t[5];
+
+            int u0 = max((int)fmin(ax, fmin(bx, cx)), 0);
+            int u1 = min((int)fmax(ax, fmax(bx, cx)) + 1, grid_resolution);
+            int v0 = max((int)fmin(ay, fmin(by, cy)), 0);
+            int v1 = min((int)fmax(ay, fmax(by, cy)) + 1, grid_resolution);
+            if (u0 >= u1 || v0 >= v1) {
+                continue;
+            }
+
+            double e0 = (bx - ax) * (v0 - ay) - (by - ay) * (u0 - ax);
+            double e1 = (cx - bx) * (v0 - by) - (cy - by) * (u0 - bx);
+            double e2 = (ax - cx) * (v0 - cy) - (ay - cy) * (u0 - cx);
+            double de0dx = -(by - ay), de0dy = bx - ax;
+            double de1dx = -(cy - by), de1dy = cx - bx;
+            double de2dx = -(ay - cy), de2dy = ax - cx;
+            if (e0 + e1 + e2 < 0) {
+                e0 = -e0; e1 = -e1; e2 = -e2;
+                de0dx = -de0dx; de0dy = -de0dy;
+                de1dx = -de1dx; de1dy = -de1dy;
+                de2dx = -de2dx; de2dy = -de2dy;
+            }
+
+            int width = u1 - u0;
+            long long n_pixels = (long long)width * (v1 - v0);
+            for (long long i = threadIdx.x; i < n_pixels; i += blockDim.x) {
+                int dx = (int)(i % width);
+                int dy = (int)(i / width);
+                if (e0 + de0dx * dx + de0dy * dy >= 0 &&
+                        e1 + de1dx * dx + de1dy * dy >= 0 &&
+                        e2 + de2dx * dx + de2dy * dy >= 0) {
+                    atomicMin(&owner[(long long)(v0 + dy) * grid_resolution + u0 + dx], f);
+                }
+            }
+        }
+    }
+    ''', 'rasterize_faces', options=('--fmad=false',))
+
+    # Errors of compiling or running the kernel: a missing NVRTC, a CUDA
+    # version mismatch or running out of device memory. The CUDA runtime,
+    # driver and NVRTC errors are all RuntimeErrors.
+    gpu_errors = (cupy.cuda.compiler.CompileException, cupy.cuda.memory.OutOfMemoryError, RuntimeError, OSError)
+
+@functools.lru_cache(maxsize=None)
+def gpu_available():
+    if cupy is None:
+        return False
+    try:
+        return cupy.cuda.runtime.getDeviceCount() > 0
+    except cupy.cuda.runtime.CUDARuntimeError:
+        return False
+
+def rasterize_faces_gpu(tri_px, grid_resolution):
+    # Returns None if the GPU cannot be used, the caller then falls back to
+    # the CPU rasterizer for this and every later mesh of the worker
+    global gpu_failed
+    n_faces = len(tri_px)
+    try:
+        owner = cupy.full(grid_resolution * grid_resolution, n_faces, dtype=np.int32)
+        blocks = min(max(n_faces, 1), 65535)
+        _rasterize_faces_gpu_kernel((blocks,), (256,), (cupy.asarray(tri_px, dtype=np.float64), np.int32(n_faces), np.int32(grid_resolution), owner))
+
+        covered = owner < n_faces
+        pixel_counts = cupy.bincount(owner[covered], minlength=n_faces)
+        grid = covered.astype(np.uint8).reshape(grid_resolution, grid_resolution)
+        return cupy.asnumpy(pixel_counts), cupy.asnumpy(grid)
+    except gpu_errors as e:
+        print(f"Error rasterizing on the GPU, using the CPU instead: {str(e)}")
+        gpu_failed = True
+        return None
+
+def use_gpu_rasterizer(tri_px, grid_resolution):
+    if gpu_failed or not len(tri_px) or not gpu_available():
+        return False
+    # Total bounding box area, i.e. the number of edge tests to run
+    extent = np.minimum(tri_px.max(axis=1), grid_resolution) - np.maximum(tri_px.min(axis=1), 0) + 1
+    return np.prod(np.maximum(extent, 0), axis=1).sum() > gpu_min_pixels
+
+def rasterize_faces_in_order(tri_px, grid_resolution):
+    if use_gpu_rasterizer(tri_px, grid_resolution):
+        result = rasterize_faces_gpu(tri_px, grid_resolution)
+        if result is not None:
+            return result
+
+    grid = np.zeros((grid_resolution, grid_resolution), dtype=np.uint8)
+
+    if numba is not None:
+        band_counts = np.zeros((numba.get_num_threads(), len(tri_px)), dtype=np.int32)
+        _rasterize_faces_numba(tri_px, grid_resolution, grid, band_counts, True)
+        return band_counts.sum(axis=0), grid
+
+    pixel_counts = np.zeros(len(tri_px), dtype=np.int64)
+    for f, triangle in enumerate(tri_px):
+        u0, u1, v0, v1 = face_pixel_range(triangle, grid_resolution)
+        if u0 >= u1 or v0 >= v1:
+            continue
+        
+        inside = rasterize_triangle(triangle, u0, u1, v0, v1)
+        
+        # Only count pixels that are not already claimed by a previous face
+        cell = grid[v0:v1, u0:u1]
+        pixel_counts[f] = np.count_nonzero(inside & ~cell.view(bool))
+        cell |= inside.view(np.uint8)
+
+    return pixel_counts, grid
+
+def rasterize_coverage(tri_px, grid_resolution):
+    # Only the union of the triangles, for the texture utilization. Nothing
+    # is counted per face, so neither the order nor duplicates matter.
+    if use_gpu_rasterizer(tri_px, grid_resolution):
+        result = rasterize_faces_gpu(tri_px, grid_resolution)
+        if result is not None:
+            return result[1]
+
+    grid = np.zeros((grid_resolution, grid_resolution), dtype=np.uint8)
+
+    if numba is not None:
+        _rasterize_faces_numba(tri_px, grid_resolution, grid, np.zeros((numba.get_num_threads(), 0), dtype=np.int32), False)
+        return grid
+
+    for triangle in tri_px:
+        u0, u1, v0, v1 = face_pixel_range(triangle, grid_resolution)
+        if u0 < u1 and v0 < v1:
+            grid[v0:v1, u0:u1] |= rasterize_triangle(triangle, u0, u1, v0, v1).view(np.uint8)
+    return grid
+
+def calculate_texel_sizes_and_utilization(mesh):
+    if mesh['face_uv'] is None:
         print("No active UV layer found")
-        return [], 0
-    
-    # Get texture information
-    image = None
-    if obj.active_material and obj.active_material.node_tree:
-        for node in obj.active_material.node_tree.nodes:
-            if node.type == 'TEX_IMAGE' and node.image:
-                image = node.image
-                break
+        return [], 0, 0
     
-    if not image:
+    if not mesh['image_size']:
         print("No valid texture found.")
-        return [], 0
+        return [], 0, 0
     
-    image_width, image_height = image.size
+    image_width, image_height = mesh['image_size']
+    face_uv = mesh['face_uv']
+    face_areas = mesh['face_areas']
+
     #grid_resolution = 512  # Set the grid_resolution of the grid to 1024x1024
     #grid_resolution = max(image_width, image_height)  # Use the larger dimension for a square grid
     fraction = 0.5  # Set the fraction of the image to sample
-    grid_resolution = int(max(image_width, image_height) * fraction)  # Use the larger dimension for a square grid
+    coverage_resolution = int(max(image_width, image_height) * fraction)  # Use the larger dimension for a square grid
 
-    grid = [[0 for _ in range(grid_resolution)] for _ in range(grid_resolution)]
-    total_pixels = grid_resolution * grid_resolution
-    texel_sizes = []
-    
-    for face in bm.faces:
-        face_area = face.calc_area()
-        uv_coords = [l[uv_layer].uv for l in face.loops]
-        
-        # Calculate bounding box of the face in UV space
-        min_u = min(uv.x for uv in uv_coords)
-        max_u = max(uv.x for uv in uv_coords)
-        min_v = min(uv.y for uv in uv_coords)
-        max_v = max(uv.y for uv in uv_coords)
-        
-        pixel_count = 0
-        # Sample points within the bounding box
-        for u in range(int(min_u * grid_resolution), min(int(max_u * grid_resolution) + 1, grid_resolution)):
-            for v in range(int(min_v * grid_resolution), min(int(max_v * grid_resolution) + 1, grid_resolution)):
-                point = Vector((u / grid_resolution, v / grid_resolution))
-                if point_in_triangle_uv(point, uv_coords):
-                    if grid[v][u] == 0:
-                        grid[v][u] = 1
-                        pixel_count += 1
-        
-        if pixel_count > 0:
-            # Calculate texel size based on the actual image grid_resolution
-            texel_size = (face_area / (pixel_count * (image_width / grid_resolution) * (image_height / grid_resolution))) ** 0.5
-            texel_sizes.append(texel_size)
-    
-    used_pixels = sum(sum(row) for row in grid)
+    # The texel sizes only need as fine a grid as the mesh: the smallest
+    # triangle in UV space should still cover about `min_face_pixels` cells.
+    # The texture utilization is estimated separately on the full coverage
+    # grid, so it does not lose precision on coarse meshes.
+    min_face_pixels = 16
+    min_grid_resolution = 128
+    edge_a = face_uv[:, 1] - face_uv[:, 0]
+    edge_b = face_uv[:, 2] - face_uv[:, 0]
+    uv_areas = 0.5 * np.abs(edge_a[:, 0] * edge_b[:, 1] - edge_a[:, 1] * edge_b[:, 0])
+    uv_areas = uv_areas[uv_areas > 0]
+    grid_resolution = int(np.sqrt(min_face_pixels / uv_areas.min())) if len(uv_areas) else coverage_resolution
+    grid_resolution = min(max(grid_resolution, min_grid_resolution), coverage_resolution)
+
+    # The rasterization only depends on the UVs and the grids, so it is shared
+    # between meshes with the same UV layout and texture size
+    raster_key = content_digest(face_uv.tobytes(), f"{grid_resolution}/{coverage_resolution}".encode())
+    cached = load_cached_rasterization(raster_key)
+    if cached is not None:
+        pixel_counts, used_pixels = cached
+    else:
+        pixel_counts, grid = rasterize_faces(face_uv * grid_resolution, grid_resolution)
+        if coverage_resolution != grid_resolution:
+            grid = rasterize_coverage(face_uv * coverage_resolution, coverage_resolution)
+        used_pixels = int(grid.sum(dtype=np.int64))
+        save_cached_rasterization(raster_key, pixel_counts, used_pixels)
+
+    # Calculate texel size based on the actual image grid_resolution
+    claimed = pixel_counts > 0
+    texel_sizes = np.sqrt(face_areas[claimed] / (pixel_counts[claimed] * (image_width / grid_resolution) * (image_height / grid_resolution)))
+
+    total_pixels = coverage_resolution * coverage_resolution
     texture_utilization = used_pixels / total_pixels
     
-    bm.free()
     return texel_sizes, texture_utilization, image_width
 
-def calculate_statistics(obj):
+def calculate_statistics(mesh):
     function_start_time = time.time()
     
     texel_start_time = time.time()
-    sizes,texture_utilization, texture_width = calculate_texel_sizes_and_utilization(obj)
+    sizes,texture_utilization, texture_width = calculate_texel_sizes_and_utilization(mesh)
     texel_end_time = time.time()
     
-    if not sizes:
+    if len(sizes) == 0:
         return None
     
     # Texel size statistics
@@ -143,17 +488,17 @@ def calculate_statistics(obj):
     
     # Polygon edge statistics
     polygon_start_time = time.time()
-    bm = bmesh.new()
-    bm.from_mesh(obj.data)
-    edge_lengths = [edge.calc_length() for edge in bm.edges]
+    verts = mesh['verts']
+    edges = mesh['edges']
+    deltas = verts[edges[:, 0]] - verts[edges[:, 1]]
+    edge_lengths = np.sqrt(np.einsum('ij,ij->i', deltas, deltas))
     avg_polygon_edge_length = np.mean(edge_lengths)
     median_polygon_edge_length = np.median(edge_lengths)
     std_dev_polygon_edge_length = np.std(edge_lengths)
     
     # Total number of polygons
-    total_polygons = len(bm.faces)
+    total_polygons = mesh['polygon_count']
     
-    bm.free()
     polygon_end_time = time.time()
     
     return {
@@ -168,14 +513,286 @@ def calculate_statistics(obj):
         'total_polygons': total_polygons
     }
 
-def process_glb_file(glb_file_path):
-    if not os.path.isfile(glb_file_path):
+### Mesh loading
+#
+# Both loaders return the mesh as a dictionary of NumPy arrays:
+# - verts: (V, 3) vertex positions,
+# - edges: (E, 2) vertex indices of the unique edges,
+# - face_uv: (F, 3, 2) UVs of every triangle, or None without UVs,
+# - face_areas: (F,) triangle areas,
+# - polygon_count: number of polygons,
+# - image_size: (width, height) of the texture, or None without a texture.
+
+gltf_component_types = {5120: np.int8, 5121: np.uint8, 5122: np.int16, 5123: np.uint16, 5125: np.uint32, 5126: np.float32}
+gltf_type_sizes = {'SCALAR': 1, 'VEC2': 2, 'VEC3': 3, 'VEC4': 4, 'MAT2': 4, 'MAT3': 9, 'MAT4': 16}
+
+# Reading a truncated or malformed GLB file raises one of these
+glb_read_errors = (ValueError, KeyError, IndexError, TypeError, AttributeError, struct.error)
+
+def parse_glb(data):
+    # Splits a binary glTF file into its JSON document and BIN chunk
+    if len(data) < 12 or data[:4] != b'glTF':
+        return None, None
+    length = min(struct.unpack_from('<I', data, 8)[0], len(data))
+    gltf, bin_chunk = None, None
+    offset = 12
+    while offset + 8 <= length:
+        chunk_length, chunk_type = struct.unpack_from('<II', data, offset)
+        chunk = memoryview(data)[offset + 8:offset + 8 + chunk_length]
+        if chunk_type == 0x4E4F534A:  # JSON
+            gltf = json.loads(bytes(chunk))
+        elif chunk_type == 0x004E4942 and bin_chunk is None:  # BIN
+            bin_chunk = chunk
+        offset += 8 + chunk_length
+    return gltf, bin_chunk
+
+def read_accessor(gltf, bin_chunk, index):
+    # Copies an accessor out of the BIN chunk. Returns None for layouts that
+    # are not stored plainly in the GLB (sparse or external buffers).
+    accessor = gltf['accessors'][index]
+    if 'sparse' in accessor or 'bufferView' not in accessor or bin_chunk is None:
+        return None
+    buffer_view = gltf['bufferViews'][accessor['bufferView']]
+    if 'uri' in gltf['buffers'][buffer_view['buffer']]:
         return None
 
-    # Clear existing mesh objects
-    bpy.ops.object.select_all(action='DESELECT')
-    bpy.ops.object.select_by_type(type='MESH')
-    bpy.ops.object.delete()
+    dtype = np.dtype(gltf_component_types[accessor['componentType']])
+    components = gltf_type_sizes[accessor['type']]
+    count = accessor['count']
+    offset = buffer_view.get('byteOffset', 0) + accessor.get('byteOffset', 0)
+    stride = buffer_view.get('byteStride') or dtype.itemsize * components
+    values = np.ndarray((count, components), dtype=dtype, buffer=bin_chunk, offset=offset, strides=(stride, dtype.itemsize)).copy()
+
+    if accessor.get('normalized') and dtype.kind in 'iu':
+        values = values / np.iinfo(dtype).max
+        if dtype.kind == 'i':
+            values = np.maximum(values, -1.0)
+    return values
+
+def read_image_size(f):
+    # Reads the dimensions from the header of a PNG or JPEG file object
+    # without decoding the image
+    signature = f.read(8)
+    if signature == b'\x89PNG\r\n\x1a\n':
+        header = f.read(16)
+        return struct.unpack('>II', header[8:16]) if len(header) == 16 else None
+    if signature[:2] != b'\xff\xd8':
+        return None
+
+    # Walk the JPEG segments up to the frame header. Large EXIF or thumbnail
+    # segments are skipped with a seek, however far the frame header is.
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        if not byte:
+            return None
+        if byte != b'\xff':
+            continue
+        marker = f.read(1)
+        while marker == b'\xff':
+            marker = f.read(1)
+        if not marker:
+            return None
+        marker = marker[0]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            continue
+        segment = f.read(7 if 0xC0 <= marker <= 0xCF else 2)
+        if len(segment) < 2:
+            return None
+        # SOFn markers, except DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            if len(segment) < 7:
+                return None
+            height, width = struct.unpack('>HH', segment[3:7])
+            return width, height
+        f.seek(struct.unpack('>H', segment[:2])[0] - len(segment), io.SEEK_CUR)
+
+def find_glb_image(gltf):
+    # The base color image of the first primitive's material, or the first image
+    images = gltf.get('images')
+    if not images:
+        return None
+    try:
+        material_index = gltf['meshes'][0]['primitives'][0].get('material')
+    except (KeyError, IndexError):
+        material_index = None
+    if material_index is not None:
+        material = gltf.get('materials', [])[material_index]
+        texture_info = material.get('pbrMetallicRoughness', {}).get('baseColorTexture')
+        if texture_info is not None:
+            image_index = gltf['textures'][texture_info['index']].get('source')
+            if image_index is not None:
+                return images[image_index]
+    return images[0]
+
+@functools.lru_cache(maxsize=256)
+def read_image_file_size(image_path):
+    # External textures are often shared by many tiles, read each one once per worker
+    with open(image_path, 'rb') as f:
+        return read_image_size(f)
+
+def find_external_image_path(gltf, base_path):
+    # Path of the texture if the GLB references a separate image file
+    image = find_glb_image(gltf)
+    if image is None or 'bufferView' in image or 'uri' not in image or image['uri'].startswith('data:'):
+        return None
+    return os.path.normpath(os.path.join(base_path, urllib.parse.unquote(image['uri'])))
+
+def read_external_image_key(gltf, base_path):
+    # The statistics also depend on an external texture, which can differ
+    # between copies of the same GLB or change between runs, so its path,
+    # size and modification time are part of the stats cache key
+    image_path = find_external_image_path(gltf, base_path) if gltf else None
+    if image_path is None:
+        return b''
+    image_path = os.path.abspath(image_path)
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return image_path.encode()
+    return f"{image_path}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+
+def read_glb_image_size(gltf, bin_chunk, base_path):
+    image = find_glb_image(gltf)
+    if image is None:
+        return None
+
+    if 'bufferView' in image:
+        buffer_view = gltf['bufferViews'][image['bufferView']]
+        if bin_chunk is None or 'uri' in gltf['buffers'][buffer_view['buffer']]:
+            return False
+        offset = buffer_view.get('byteOffset', 0)
+        image_size = read_image_size(io.BytesIO(bin_chunk[offset:offset + buffer_view['byteLength']]))
+    elif image.get('uri', '').startswith('data:'):
+        image_size = read_image_size(io.BytesIO(base64.b64decode(image['uri'].split(',', 1)[1])))
+    elif 'uri' in image:
+        try:
+            image_size = read_image_file_size(find_external_image_path(gltf, base_path))
+        except OSError:
+            return None
+    else:
+        return None
+
+    # False means the image format is unknown here and Blender has to read it
+    return image_size or False
+
+def load_glb_mesh(gltf, bin_chunk, base_path):
+    # Reads the first mesh of a parsed GLB file straight from its buffers.
+    # Returns None if the file needs the Blender importer (e.g. Draco or
+    # meshopt compression, non-triangle primitives).
+    if gltf is None or not gltf.get('meshes'):
+        return None
+    if gltf.get('extensionsRequired'):
+        return None
+
+    verts, faces, uvs = [], [], []
+    has_uv = False
+    vertex_offset = 0
+    primitives = gltf['meshes'][0]['primitives']
+    for primitive in primitives:
+        attributes = primitive.get('attributes', {})
+        if primitive.get('extensions') or primitive.get('mode', 4) != 4 or 'POSITION' not in attributes:
+            return None
+        positions = read_accessor(gltf, bin_chunk, attributes['POSITION'])
+        if positions is None:
+            return None
+        if 'indices' in primitive:
+            indices = read_accessor(gltf, bin_chunk, primitive['indices'])
+            if indices is None:
+                return None
+        else:
+            indices = np.arange(len(positions))
+        if 'TEXCOORD_0' in attributes:
+            uv = read_accessor(gltf, bin_chunk, attributes['TEXCOORD_0'])
+            if uv is None:
+                return None
+            has_uv = True
+        else:
+            uv = np.zeros((len(positions), 2))
+
+        verts.append(positions.astype(np.float64))
+        faces.append(indices.reshape(-1, 3).astype(np.int64) + vertex_offset)
+        uvs.append(uv.astype(np.float32))
+        vertex_offset += len(positions)
+
+    verts = np.concatenate(verts)
+    faces = np.concatenate(faces)
+
+    face_uv = None
+    if has_uv:
+        # Blender flips V on import, do the same so both loaders agree
+        uv = np.concatenate(uvs)
+        uv[:, 1] = 1 - uv[:, 1]
+        face_uv = uv[faces].astype(np.float64)
+
+    corners = verts[faces]
+    face_areas = 0.5 * np.linalg.norm(np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1)
+
+    edges = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+    edges = np.unique(np.sort(edges, axis=1), axis=0)
+
+    image_size = read_glb_image_size(gltf, bin_chunk, base_path)
+    if image_size is False:
+        return None
+
+    return {
+        'verts': verts,
+        'edges': edges,
+        'face_uv': face_uv,
+        'face_areas': face_areas,
+        'polygon_count': len(faces),
+        'image_size': image_size
+    }
+
+def load_blender_mesh(obj):
+    me = obj.data
+
+    edges = np.empty(len(me.edges) * 2, dtype=np.int32)
+    me.edges.foreach_get('vertices', edges)
+    verts = np.empty(len(me.vertices) * 3, dtype=np.float32)
+    me.vertices.foreach_get('co', verts)
+    verts = verts.reshape(-1, 3).astype(np.float64)
+
+    # Triangulate the polygons, so n-gons are rasterized completely
+    me.calc_loop_triangles()
+    triangle_count = len(me.loop_triangles)
+    triangle_loops = np.empty(triangle_count * 3, dtype=np.int32)
+    me.loop_triangles.foreach_get('loops', triangle_loops)
+    triangle_loops = triangle_loops.reshape(-1, 3)
+    triangle_verts = np.empty(triangle_count * 3, dtype=np.int32)
+    me.loop_triangles.foreach_get('vertices', triangle_verts)
+
+    corners = verts[triangle_verts.reshape(-1, 3)]
+    face_areas = 0.5 * np.linalg.norm(np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1)
+
+    face_uv = None
+    uv_layer = me.uv_layers.active
+    if uv_layer:
+        uv = np.empty(len(me.loops) * 2, dtype=np.float32)
+        uv_layer.data.foreach_get('uv', uv)
+        face_uv = uv.reshape(-1, 2)[triangle_loops].astype(np.float64)
+
+    # Get texture information
+    image = None
+    if obj.active_material and obj.active_material.node_tree:
+        for node in obj.active_material.node_tree.nodes:
+            if node.type == 'TEX_IMAGE' and node.image:
+                image = node.image
+                break
+
+    return {
+        'verts': verts,
+        'edges': edges.reshape(-1, 2),
+        'face_uv': face_uv,
+        'face_areas': face_areas,
+        'polygon_count': len(me.polygons),
+        'image_size': tuple(image.size) if image else None
+    }
+
+def import_glb_with_blender(glb_file_path):
+    if bpy is None:
+        print(f"Error importing file {glb_file_path}: it can only be read by Blender, run the script with Blender")
+        return None
 
     try:
         # Suppress Blender output
@@ -184,14 +801,78 @@ def process_glb_file(glb_file_path):
             bpy.ops.import_scene.gltf(filepath=glb_file_path)
     except RuntimeError as e:
         print(f"Error importing file {glb_file_path}: {str(e)}")
+        clear_blender_data()
         return None
 
-    stats = {}
+    mesh = None
     for obj in bpy.context.scene.objects:
         if obj.type == 'MESH':
-            stats = calculate_statistics(obj)
+            mesh = load_blender_mesh(obj)
             break  # Assuming we only need stats for the first mesh object
 
+    # The worker is reused for many tiles, so leave nothing behind
+    clear_blender_data()
+    return mesh
+
+def clear_blender_data():
+    # Deleting the objects leaves their meshes, materials and images in
+    # bpy.data, so remove those explicitly as well
+    bpy.data.batch_remove(bpy.data.objects)
+    for datablocks in (bpy.data.meshes, bpy.data.materials, bpy.data.images, bpy.data.textures, bpy.data.node_groups):
+        bpy.data.batch_remove(list(datablocks))
+    bpy.data.orphans_purge(do_recursive=True)
+
+def read_glb_bytes(glb_file_path):
+    try:
+        with open(glb_file_path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def prefetch_glb_bytes(glb_file_path):
+    if prefetch_executor is None:
+        future = concurrent.futures.Future()
+        future.set_result(read_glb_bytes(glb_file_path))
+        return future
+    return prefetch_executor.submit(read_glb_bytes, glb_file_path)
+
+def process_glb_file(glb_file_path, data=None):
+    if data is None:
+        data = read_glb_bytes(glb_file_path)
+    if data is None:
+        return None
+
+    # Identical GLB files (shared across LODs or tilesets) are only processed once
+    base_path = os.path.dirname(glb_file_path)
+    read_error = None
+    try:
+        gltf, bin_chunk = parse_glb(data)
+        image_key = read_external_image_key(gltf, base_path)
+    except glb_read_errors as e:
+        gltf, bin_chunk, image_key, read_error = None, None, b'', e
+    stats_key = content_digest(data, image_key)
+    cached_stats = load_cached_stats(stats_key)
+    if cached_stats is not None:
+        return cached_stats
+
+    mesh = None
+    if read_error is None:
+        try:
+            mesh = load_glb_mesh(gltf, bin_chunk, base_path)
+        except glb_read_errors as e:
+            read_error = e
+    if mesh is None:
+        # A file that cannot be read is skipped, unless Blender can still import it
+        if read_error is not None and bpy is None:
+            print(f"Error importing file {glb_file_path}: {str(read_error)}")
+            return None
+        mesh = import_glb_with_blender(glb_file_path)
+    if mesh is None:
+        return None
+
+    stats = calculate_statistics(mesh)
+    if stats:
+        save_cached_stats(stats_key, stats)
     return stats
 
 ### Writing csv to disk
@@ -203,8 +884,7 @@ def get_unique_tile_id():
 
 def load_tileset(tileset_path):
     print(f"Loading tileset: {tileset_path}")
-    with open(tileset_path, 'r') as f:
-        tileset_data = json.load(f)
+    tileset_data = load_json(tileset_path)
     
     root_tile = tileset_data.get('root', {})
     tiles_to_process = []
@@ -216,60 +896,94 @@ def load_tileset(tileset_path):
     print(f"Total tiles to process: {len(tiles_to_process)}")
     return tiles_to_process
 
-def process_tile_structure(tile, parent_id, lod_level, tiles_to_process, base_path):
-    tile_content = tile.get('content', {})
-    tile_uri_template = tile_content.get('uri')
-    
-    screen_space_error = tile.get('geometricError', None)
-    
-    if tile_uri_template and '{level}' in tile_uri_template:
-        # This is an implicit tiling structure
-        pattern = re.compile(r'tiles/(\d+)/(\d+)/(\d+)/(\d+)\.glb')
+@functools.lru_cache(maxsize=None)
+def scan_implicit_tiles(base_path):
+    # Finds every tiles/<level>/<x>/<y>/<z>.glb below base_path. The scan is
+    # cached, so implicit roots sharing a base path only walk the tree once.
+    tiles = []
+    pending = [os.path.join(base_path, 'tiles')]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith('.glb'):
+                    relative_path = os.path.relpath(entry.path, base_path)
+                    parts = relative_path.split(os.sep)
+                    coords = parts[1:4] + [parts[-1][:-len('.glb')]]
+                    if len(parts) == 5 and all(c.isdigit() for c in coords):
+                        level, x, y, z = map(int, coords)
+                        tiles.append((level, x, y, z, relative_path))
+    tiles.sort()
+    return tuple(tiles)
+
+@functools.lru_cache(maxsize=None)
+def load_json(path):
+    # Nested tilesets referenced by several tiles are only read and parsed once
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def process_tile_structure(root_tile, root_parent_id, root_lod_level, tiles_to_process, root_base_path):
+    # Depth-first walk with an explicit stack, so deep hierarchies do not hit
+    # the recursion limit. Tiles are visited in the same order as a
+    # recursive walk, which keeps the tile ids stable.
+    stack = [(root_tile, root_parent_id, root_lod_level, root_base_path)]
+    while stack:
+        tile, parent_id, lod_level, base_path = stack.pop()
+        tile_content = tile.get('content', {})
+        tile_uri_template = tile_content.get('uri')
         
-        for root, dirs, files in os.walk(os.path.join(base_path, 'tiles')):
-            for file in files:
-                if file.endswith('.glb'):
-                    full_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(full_path, base_path)
-                    match = pattern.match(relative_path)
-                    if match:
-                        level, x, y, z = map(int, match.groups())
-                        tile_id = get_unique_tile_id()
-                        tiles_to_process.append({
-                            'lod_level': level,
-                            'tile_id': tile_id,
-                            'parent_id': parent_id,
-                            'tile_url': relative_path,
-                            'screen_space_error': screen_space_error,
-                            'base_path': base_path,
-                            'x': x,
-                            'y': y,
-                            'z': z
-                        })
-    else:
-        # Handle v1.0 tiles as before
-        tile_url = tile_content.get('uri') or tile_content.get('url')
-        if tile_url:
-            if tile_url.endswith('.json'):
-                nested_tileset_path = os.path.join(base_path, tile_url)
-                with open(nested_tileset_path, 'r') as f:
-                    nested_tileset_data = json.load(f)
-                nested_root = nested_tileset_data.get('root', {})
-                process_tile_structure(nested_root, parent_id, lod_level, tiles_to_process, os.path.dirname(nested_tileset_path))
-            elif tile_url.endswith('.glb'):
+        screen_space_error = tile.get('geometricError', None)
+        
+        # Tiles without content of their own pass their parent on to their children
+        tile_id = parent_id
+        nested_root = None
+        
+        if tile_uri_template and '{level}' in tile_uri_template:
+            # This is an implicit tiling structure
+            for level, x, y, z, relative_path in scan_implicit_tiles(base_path):
                 tile_id = get_unique_tile_id()
                 tiles_to_process.append({
-                    'lod_level': lod_level,
+                    'lod_level': level,
                     'tile_id': tile_id,
                     'parent_id': parent_id,
-                    'tile_url': tile_url,
+                    'tile_url': relative_path,
                     'screen_space_error': screen_space_error,
-                    'base_path': base_path
+                    'base_path': base_path,
+                    'x': x,
+                    'y': y,
+                    'z': z
                 })
+        else:
+            # Handle v1.0 tiles as before
+            tile_url = tile_content.get('uri') or tile_content.get('url')
+            if tile_url:
+                if tile_url.endswith('.json'):
+                    nested_tileset_path = os.path.join(base_path, tile_url)
+                    nested_tileset_data = load_json(os.path.normpath(nested_tileset_path))
+                    nested_root = (nested_tileset_data.get('root', {}), parent_id, lod_level, os.path.dirname(nested_tileset_path))
+                elif tile_url.endswith('.glb'):
+                    tile_id = get_unique_tile_id()
+                    tiles_to_process.append({
+                        'lod_level': lod_level,
+                        'tile_id': tile_id,
+                        'parent_id': parent_id,
+                        'tile_url': tile_url,
+                        'screen_space_error': screen_space_error,
+                        'base_path': base_path
+                    })
 
-    if 'children' in tile:
-        for child in tile['children']:
-            process_tile_structure(child, tile_id, lod_level + 1, tiles_to_process, base_path)
+        # Push in reverse so the nested tileset comes first, then the children in order
+        if 'children' in tile:
+            for child in reversed(tile['children']):
+                stack.append((child, tile_id, lod_level + 1, base_path))
+        if nested_root is not None:
+            stack.append(nested_root)
 
 def write_results_to_csv(results, output_file):
     # Group results by LOD level
@@ -287,71 +1001,168 @@ def write_results_to_csv(results, output_file):
         for key in group[0].keys():
             if key == 'total_polygons':
                 avg_result[key] = sum(r[key] for r in group)
-            elif key not in ['lod_level', 'tile_id'] and isinstance(group[0][key], (int, float)):
+            elif key not in ['lod_level', 'tile_id', 'parent_id'] and isinstance(group[0][key], (int, float)):
                 avg_result[key] = sum(r[key] for r in group) / len(group)
         summary.append(avg_result)
 
     # Write to CSV
-    keys = results[0].keys()
+    keys = list(results[0].keys())
     with open(output_file, 'w', newline='') as f:
-        dict_writer = csv.DictWriter(f, fieldnames=keys)
+        writer = csv.writer(f)
         
         # Write summary
-        dict_writer.writeheader()
-        for row in summary:
-            rounded_row = {k: f'{v:.4f}' if isinstance(v, float) else v for k, v in row.items()}
-            dict_writer.writerow(rounded_row)
+        writer.writerow(keys)
+        write_rounded_rows(writer, keys, summary)
         
         # Add empty rows
-        for _ in range(3):
-            dict_writer.writerow({})
+        writer.writerows([[''] * len(keys)] * 3)
         
         # Write raw data
-        dict_writer.writeheader()
-        for row in results:
-            rounded_row = {k: f'{v:.4f}' if isinstance(v, float) else v for k, v in row.items()}
-            dict_writer.writerow(rounded_row)
-
-def process_tile_parallel(tile_info):
-    glb_file_path = os.path.join(tile_info['base_path'], tile_info['tile_url'])
-    stats = process_glb_file(glb_file_path)
-    
-    if stats:
-        return {
-            'lod_level': tile_info['lod_level'],
-            'tile_id': tile_info['tile_id'],
-            'parent_id': tile_info['parent_id'],
-            'tile_uri': tile_info['tile_url'],
-            'screen_space_error': tile_info['screen_space_error'],
-            **stats
-        }
-    return None
+        writer.writerow(keys)
+        write_rounded_rows(writer, keys, results)
+
+def write_rounded_rows(writer, keys, rows):
+    # Floats are rounded to 4 decimals. Columns that only hold floats are
+    # formatted in a single NumPy call instead of value by value.
+    columns = []
+    for key in keys:
+        values = [row.get(key) for row in rows]
+        if values and all(isinstance(v, float) for v in values):
+            columns.append(np.char.mod('%.4f', np.array(values, dtype=np.float64)).tolist())
+        else:
+            columns.append([f'{v:.4f}' if isinstance(v, float) else v for v in values])
+    writer.writerows(zip(*columns))
+
+def init_worker(rasterizer_threads):
+    # Runs once when a worker process starts, the worker then keeps its
+    # Blender session and prefetch thread for all the tiles it is given
+    global prefetch_executor
+    prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    if numba is not None:
+        # The pool already runs a process per core, only give the parallel
+        # rasterizer the cores that no other worker is using
+        numba.set_num_threads(min(rasterizer_threads, numba.config.NUMBA_NUM_THREADS))
+    if bpy is not None:
+        with suppress_output():
+            bpy.ops.wm.read_factory_settings(use_empty=True)
+
+def get_pool_context():
+    # forkserver workers are forked from a server process that has already
+    # imported this script, NumPy and Numba, so they start warm without
+    # copying the parent's memory, including the ones recycled after
+    # maxtasksperchild. The server is started with sys.executable, which in
+    # Blender is the bundled Python without bpy, so Blender runs keep the
+    # default start method.
+    if bpy is None and 'forkserver' in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context('forkserver')
+        ctx.set_forkserver_preload(['__main__', 'numpy'])
+        return ctx
+    return multiprocessing.get_context()
+
+def get_tile_file_size(tile_info):
+    try:
+        return os.path.getsize(os.path.join(tile_info['base_path'], tile_info['tile_url']))
+    except OSError:
+        return 0
+
+def group_tiles_by_file(tiles_to_process):
+    # Tiles referencing the same GLB file go to the same worker, which only processes the file once
+    buckets = {}
+    for tile_info in tiles_to_process:
+        glb_file_path = os.path.normpath(os.path.join(tile_info['base_path'], tile_info['tile_url']))
+        buckets.setdefault(glb_file_path, []).append(tile_info)
+    return list(buckets.values())
+
+def process_tile_buckets(buckets):
+    # Every distinct GLB file in the buckets is only processed once. While a
+    # file is processed, the next one is already read in the background.
+    glb_file_paths = list(dict.fromkeys(
+        os.path.normpath(os.path.join(tile_info['base_path'], tile_info['tile_url']))
+        for bucket in buckets for tile_info in bucket
+    ))
+
+    stats_by_path = {}
+    next_data = prefetch_glb_bytes(glb_file_paths[0]) if glb_file_paths else None
+    for i, glb_file_path in enumerate(glb_file_paths):
+        data = next_data.result()
+        if i + 1 < len(glb_file_paths):
+            next_data = prefetch_glb_bytes(glb_file_paths[i + 1])
+        stats_by_path[glb_file_path] = process_glb_file(glb_file_path, data)
+
+    results = []
+    for bucket in buckets:
+        for tile_info in bucket:
+            stats = stats_by_path[os.path.normpath(os.path.join(tile_info['base_path'], tile_info['tile_url']))]
+            if stats:
+                results.append({
+                    'lod_level': tile_info['lod_level'],
+                    'tile_id': tile_info['tile_id'],
+                    'parent_id': tile_info['parent_id'],
+                    'tile_uri': tile_info['tile_url'],
+                    'screen_space_error': tile_info['screen_space_error'],
+                    **stats
+                })
+            else:
+                results.append(None)
+    return results
 
 def main():
-    if len(sys.argv) < 6:
-        print("Usage: blender --background --python script.py -- <path_to_tileset.json> <output_csv_filename>")
+    # Blender passes the script arguments after '--'
+    args = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else sys.argv[1:]
+    if len(args) < 2:
+        print("Usage: python script.py <path_to_tileset.json> <output_csv_filename>")
+        print("   or: blender --background --python script.py -- <path_to_tileset.json> <output_csv_filename>")
         sys.exit(1)
 
-    tileset_path = sys.argv[-2]
-    output_csv = sys.argv[-1]
+    tileset_path = args[-2]
+    output_csv = args[-1]
 
     tiles_to_process = load_tileset(tileset_path)
     total_tiles = len(tiles_to_process)
 
-    # Create a pool of worker processes
-    with multiprocessing.Pool() as pool:
+    # Start the largest buckets first so a few heavy tiles do not end up
+    # running alone at the end of the run
+    for tile_info in tiles_to_process:
+        tile_info['file_size'] = get_tile_file_size(tile_info)
+    buckets = group_tiles_by_file(tiles_to_process)
+    buckets.sort(key=lambda bucket: -sum(t['file_size'] for t in bucket))
+
+    # Hand the buckets out in small batches of distinct files, so the
+    # worker can prefetch the next file. The sorted buckets are dealt out
+    # round-robin, so the largest files land in different batches and every
+    # core gets a batch when there are enough files.
+    batch_size = 4
+    cpu_count = os.cpu_count() or 1
+    n_batches = max(-(-len(buckets) // batch_size), min(len(buckets), cpu_count))
+    batches = [buckets[i::n_batches] for i in range(n_batches)]
+
+    # Create a pool of worker processes, one per core. With Numba the pool
+    # shrinks to the number of batches and the workers' rasterizer threads
+    # use the spare cores, the NumPy fallback only runs on one thread.
+    # Workers are recycled after a number of tiles to bound their memory use
+    processes = max(min(cpu_count, len(batches)), 1) if numba is not None else cpu_count
+    with get_pool_context().Pool(processes, initializer=init_worker, initargs=(max(cpu_count // processes, 1),), maxtasksperchild=64) as pool:
         # Process tiles in parallel with progress indication
         results = []
-        for i, result in enumerate(pool.imap(process_tile_parallel, tiles_to_process), 1):
-            results.append(result)
-            print(f"****  Processed {i}/{total_tiles} tiles. Remaining: {total_tiles - i}")
+        processed = 0
+        for batch_results in pool.imap_unordered(process_tile_buckets, batches):
+            results.extend(batch_results)
+            processed += len(batch_results)
+            print(f"****  Processed {processed}/{total_tiles} tiles. Remaining: {total_tiles - processed}")
+
+        # Let the workers exit on their own, leaving the pool terminates them,
+        # which skips their cleanup and leaks the locks they created
+        pool.close()
+        pool.join()
 
     # Filter out None results and sort by LOD level
     valid_results = [r for r in results if r is not None]
-    valid_results.sort(key=lambda x: x['lod_level'])
+    valid_results.sort(key=lambda x: (x['lod_level'], x['tile_id']))
 
     # Write results to CSV
     write_results_to_csv(valid_results, output_csv)
+    if cache_enabled:
+        prune_cache()
     print(f"Script execution time: {time.time() - script_start_time} seconds")
 
 if __name__ == "__main__":